@@ -16,9 +16,10 @@ __license__ = "Apache License 2.0"
 __version__ = "0.5.0"
 
 
-from typing import Optional, List, Dict, Callable
+from typing import Optional, List, Dict, Callable, Final
 from functools import wraps
 import logging
+import textwrap
 
 from snowflake.snowpark.session import Session
 import streamlit as st
@@ -27,6 +28,64 @@ from streamlit import delta_generator as dg
 from snowflake_ai.apps import TabRegistry
 
 
+_PAGE_CSS: Final[str] = textwrap.dedent('''
+    <style>
+        .appview-container .main .block-container {
+            max-width: 100%;
+            padding-top: 0rem;
+            padding-right: 0rem;
+            padding-left: 0rem;
+            padding-bottom: 0rem;
+        }
+
+        .stTabs [data-baseweb="tab-list"]
+            button [data-testid="stMarkdownContainer"] 
+            p { font-size: 1.5rem; color: #1D8CCC}
+
+    </style>
+''').strip()
+
+_LOGO_CSS: Final[str] = textwrap.dedent('''
+    <style>
+        [data-testid="stSidebarNav"] {
+            background-image: url(app/static/ecolab-logo.png);
+            background-repeat: no-repeat;
+            padding-top: 120px;
+            background-position: 8px 140px;
+            background-size: 280px 80px;
+        }
+        [data-testid="stSidebarNav"]::before {
+            content: "Insight Service";
+            margin-left: 20px;
+            margin-top: 20px;
+            font-size: 30px;
+            position: relative;
+            top: 100px;
+            color: #007AC3;
+        }
+    </style>
+''').strip()
+
+_CSS: Final[Dict[str, str]] = {"page": _PAGE_CSS, "logo": _LOGO_CSS}
+
+
+@st.cache_data(show_spinner=False)
+def _inject_css(tag: str) -> None:
+    # cached markdown element is replayed on rerun
+    st.markdown(_CSS[tag], unsafe_allow_html=True)
+
+
+# st.fragment (or experimental_fragment) when available in streamlit
+_fragment = getattr(st, "fragment", None) or \
+        getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+
+@_fragment
+def _render_tab(func: Callable, session: Session) -> None:
+    # interaction within this tab only reruns this tab's function
+    func(session)
+
+
 
 class AppPage:
     """
@@ -46,6 +105,11 @@ class AppPage:
         ...
         >>> home_page = AppPage("home", "Home", page_home)
     """
+    __slots__ = (
+        "page_id", "title", "icon", "layout", "show_sidebar", "show_tab",
+        "tab_registry", "session", "func"
+    )
+
     _logger = logging.getLogger(__name__)
 
     def __init__(
@@ -74,43 +138,25 @@ class AppPage:
 
 
     def link_login(self, url):
-        st.markdown(
-            f"<a href='{url}' target = '_self'>Login</a>", 
-            unsafe_allow_html=True
-        )
+        self._link("Login", url)
 
 
     def link_logoff(self, url):
+        self._link("Logoff", url)
+
+
+    @staticmethod
+    def _link(label: str, url: str):
+        # oauth redirects must stay in the same tab, which st.link_button
+        # (always a new tab) can't do
         st.markdown(
-            f"<a href='{url}' target = '_self'>Logoff</a>", 
+            f"<a href='{url}' target = '_self'>{label}</a>", 
             unsafe_allow_html=True
         )
 
 
     def add_logo(self):
-        st.markdown(
-            """
-            <style>
-                [data-testid="stSidebarNav"] {
-                    background-image: url(app/static/ecolab-logo.png);
-                    background-repeat: no-repeat;
-                    padding-top: 120px;
-                    background-position: 8px 140px;
-                    background-size: 280px 80px;
-                }
-                [data-testid="stSidebarNav"]::before {
-                    content: "Insight Service";
-                    margin-left: 20px;
-                    margin-top: 20px;
-                    font-size: 30px;
-                    position: relative;
-                    top: 100px;
-                    color: #007AC3;
-                }
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
+        _inject_css("logo")
         
         
     def render_sidebar(self):
@@ -118,58 +164,44 @@ class AppPage:
         Overwritten by its child class
         """
         self.add_logo()
-        is_login = getattr(st.session_state, "login", False)
+        is_login = getattr(st.session_state, "login", None)
         sts: Dict = st.experimental_get_query_params()
         state = sts.get("state")
-        loggedin = False
-        if state:
-            t = state[0]
-            loggedin = True if t == "loggedin" else False
+        current_state = state[0] if state else None
+        if current_state is not None:
+            loggedin = current_state == "loggedin"
         else:
-            loggedin = is_login
-
-        if not loggedin:
-            st.experimental_set_query_params(
-                page="/", state="loggedoff"
-            )
-            setattr(st.session_state, "login", False)
+            loggedin = bool(is_login)
 
-        else:
+        if loggedin:
             url = "http://localhost:8501/home"
             with st.sidebar:
                 self.link_logoff(url)
 
+        # only mutate url/session state when it actually changes; the
+        # url is reset to the root page on every pass otherwise
+        desired_state = "loggedin" if loggedin else "loggedoff"
+        if sts != {"page": ["/"], "state": [desired_state]}:
             st.experimental_set_query_params(
-                page="/", state="loggedin",
+                page="/", state=desired_state
             )
-            setattr(st.session_state, "login", True)
+        if is_login != loggedin:
+            setattr(st.session_state, "login", loggedin)
 
 
     def render(self):
-        css = '''
-            <style>
-                .appview-container .main .block-container {{
-                    max-width: 100%;
-                    padding-top: 0rem;
-                    padding-right: 0rem;
-                    padding-left: 0rem;
-                    padding-bottom: {1}rem; 
-                }}
-
-                .stTabs [data-baseweb="tab-list"]
-                    button [data-testid="stMarkdownContainer"] 
-                    p { font-size: 1.5rem; color: #1D8CCC}
-
-                </style>
-            '''
-        st.markdown(css, unsafe_allow_html=True)
+        _inject_css("page")
 
         if self.show_sidebar:
             self.render_sidebar()
 
         if self.show_tab:
             self.tab_registry.create_page_tabs()
-            for t in self.tab_registry.tab_list:
-                with t.get_tab():
-                    t.func(self.session)
+            pairs = tuple(
+                (t.get_tab(), t.func) for t in self.tab_registry.tab_list
+            )
+            session = self.session
+            for tab_cm, fn in pairs:
+                with tab_cm:
+                    _render_tab(fn, session)
 
@@ -22,7 +22,9 @@ import sys
 from typing import Optional, Union, Dict
 from typing import List, Tuple, Any
 import logging
+from functools import cached_property
 from types import ModuleType
+from weakref import WeakSet
 
 from pandas._typing import (
     Dtype,
@@ -37,12 +39,19 @@ from snowflake.snowpark import Session
 from snowflake_ai.common import AppConfig
 from snowflake_ai.common import ConfigManager
 from snowflake_ai.common import ConfigKey, ConfigType, AppType
+from snowflake_ai.common import AppNamespaces
 from snowflake_ai.connect import ConnectManager, SnowConnect
 from snowflake_ai.connect import DataFrameFactory as DFF
 from snowflake_ai.snowpandas import SetupManager, DataSetup, SnowSetup
 from snowflake_ai.mlops import FlowContext, Pipeline
 
 
+
+# snowflake sessions which already have the week policy altered
+_week_policy_sessions: "WeakSet[Session]" = WeakSet()
+
+
+
 class BaseApp:
     """
     This class represents a base application's configurations and 
@@ -70,6 +79,15 @@ class BaseApp:
     # app_key : app specific config dictionary
     _base_apps : Dict [str, Dict] = {}
 
+    # AppConfig attributes read through this app
+    _config_attrs = frozenset((
+        "app_key", "root_path", "app_name", "app_group", "app_short_name",
+        "type", "group_config", "version", "domain_env", "app_path",
+        "script_home", "app_base_config", "app_connect_refs", "ml_ops_refs",
+        "oauth_connect_configs", "data_connect_configs", "data_setup_refs",
+        "ml_pipeline_refs"
+    ))
+
 
     def __init__(
         self,
@@ -90,34 +108,19 @@ class BaseApp:
         self.logger = self._logger
         ac: AppConfig = ConfigManager.get_app_config(
                 app_key, config_dir, config_file)
-        self.logger.debug(
-                f"BaseApp.init(): AppConfig - AppKey [{ac.app_key}]; "\
-                f"Version [{ac.version}]; Root_path [{ac.root_path}];"\
-                f" Script_home [{ac.script_home}].")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                    "BaseApp.init(): AppConfig - AppKey [%s]; Version [%s]"\
+                    "; Root_path [%s]; Script_home [%s].", ac.app_key,
+                    ac.version, ac.root_path, ac.script_home)
         self.appconf = ac
         self.all_configs = AppConfig.get_all_configs()
-        self.app_key = ac.app_key
-        self.root_path = ac.root_path
         self.app_configs = ac.app_config
-        self.app_name = ac.app_name
-        self.app_group = ac.app_group
-        self.app_short_name = ac.app_short_name
-        self.type = ac.type
-        self.group_config = ac.group_config
-        self.version = ac.version
-        self.domain_env = ac.domain_env
-        self.app_path = ac.app_path
-        self.script_home = ac.script_home
-        self.app_base_config = ac.app_base_config
-        self.app_connect_refs = ac.app_connect_refs
-        self.ml_ops_refs = ac.ml_ops_refs
-        self.oauth_connect_configs = ac.oauth_connect_configs
-        self.data_connect_configs = ac.data_connect_configs
-        self.data_setup_refs = ac.data_setup_refs
-        self.ml_pipeline_refs = ac.ml_pipeline_refs
+        self._cached_session: Optional[Session] = None
         
-        if self.type not in [AppType.Default.value, AppType.Console,
-                AppType.Notebook.value, AppType.Streamlit.value]:
+        try:
+            self._type_enum: AppType = AppType(self.type)
+        except ValueError:
             raise TypeError(
                 "Base.init(): Application type configuration Error!"
             )
@@ -129,34 +132,46 @@ class BaseApp:
                 self.appconf, self.snow_connect)
         self.setup_module = self.load_module(self.default_setup.script)
         self.default_context = FlowContext()
-        self.app_namespaces = self.get_app_namespaces()
-        self.default_context.data["app_namespace"] = self.app_namespaces[0]
-        self.default_context.data["app_name"] = self.app_namespaces[1]
+        self.app_namespaces = ns = self.get_app_namespaces()
+        self.default_context.data.update({
+            "app_namespace": ns.namespace, "app_name": ns.name
+        })
         self.default_context.debug = False
 
         # overridden by children    
         session: Session = self.get_snowflake_session({})
-        print(f"[TL] base app get session => {session}")
         if session is not None:
             self.default_context.session = session
             self.set_traditional_western_week_policy(session)
-            if len(self.ml_pipeline_refs) > 0:
-                pipeline_key = self.ml_pipeline_refs[0]
-                self.default_pipeline = Pipeline(
-                        pipeline_key, self.default_context, self.appconf)
         else:
-            self.logger.debug(f"BaseApp.init(): Got session [{session}]")
+            self.logger.debug("BaseApp.init(): Got session [%s]", session)
 
 
 
+    def __getattr__(self, name: str) -> Any:
+        """
+        Delegate lookup of app config attributes not set on this app,
+        e.g., app_key, type, root_path, script_home, etc., to its
+        AppConfig object.
+        """
+        if name not in BaseApp._config_attrs:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        return getattr(self.appconf, name)
+
+
     def set_traditional_western_week_policy(
         self, 
         session: Optional[Session] = None
     ):
         if session is None:
             session = self.get_snowflake_session()
+        if session in _week_policy_sessions:
+            return
         session.sql("ALTER SESSION SET WEEK_OF_YEAR_POLICY=1, WEEK_START=7")\
             .collect()
+        _week_policy_sessions.add(session)
 
 
     def create_df(
@@ -181,6 +196,7 @@ class BaseApp:
                 data, session, columns, index, dtype
             )
         except Exception as e:
+            self._cached_session = None
             conn: SnowConnect = self.snow_connect
             session = conn.create_service_session()
             sdf = DFF.create_df(
@@ -243,27 +259,66 @@ class BaseApp:
         return self.default_setup
 
 
-    def get_snowflake_session(self, ctx: Dict = {}) -> Session:
+    def get_snowflake_session(
+        self,
+        ctx: Optional[Dict[str, Any]] = None
+    ) -> Session:
+        if ctx is None:
+            ctx = {}
+        session = self._cached_session
+        if session is not None and not session.connection.is_closed():
+            return session
+
         session = None
         if self.snow_connect is not None:
             session = self.snow_connect.get_connection()
             if session is None:
-                session = self.snow_connect.create_user_session(ctx)
+                session = self.snow_connect.create_user_session(
+                        self._acquire_ctx(ctx))
 
+        self._cached_session = session
         return session
 
 
+    def _acquire_ctx(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Acquire context (e.g., OAuth tokens) for user session creation.
+        Overridden by children for specific authorization flows.
+        """
+        return ctx
+
+
     def get_default_pipeline_config(self, pipeline_key):
         _, d = self.get_group_item_config(
                 pipeline_key, ConfigType.MLPipelines.value, self.appconf)
         return d
 
 
+    @cached_property
+    def default_pipeline(self) -> Optional[Pipeline]:
+        """
+        Lazily create the default ML pipeline on first access; None if
+        no session is available or no ml pipeline is referenced.
+        """
+        if self.default_context.session is None:
+            return None
+        if len(self.ml_pipeline_refs) > 0:
+            pipeline_key = self.ml_pipeline_refs[0]
+            return Pipeline(pipeline_key, self.default_context, self.appconf)
+        return None
+
+
     def run_default_pipeline(self):
-        self.default_pipeline.run()
+        pipeline = self.default_pipeline
+        if pipeline is None:
+            raise ValueError(
+                "BaseApp.run_default_pipeline(): Error - no default "\
+                "pipeline, session or ml pipeline reference is missing!"
+            )
+        pipeline.run()
     
 
-    def get_app_namespaces(self) -> Tuple[str, str]:
+    def get_app_namespaces(self) -> AppNamespaces:
         return self.appconf.get_app_namespaces()
 
 
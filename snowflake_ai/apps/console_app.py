@@ -32,7 +32,6 @@ from pandas import DataFrame as DF
 
 from snowflake.snowpark.dataframe import DataFrame as SDF
 from snowflake.snowpark.types import StructType
-from snowflake.snowpark import Session
 
 from snowflake_ai.apps import BaseApp
 from snowflake_ai.connect import DeviceCodeConnect
@@ -85,25 +84,11 @@ class ConsoleApp(BaseApp):
 
 
 
-    def get_snowflake_session(self, ctx: Dict = {}) -> Session:
-        session = None
-        if self.snow_connect is not None:
-            session = self.snow_connect.get_connection()
-            if session is None:
-                dc: DeviceCodeConnect = self.snow_connect.get_oauth_connect()
-                self.logger.debug(
-                    f"ConsoleApp.get_snowflake_session(): "\
-                    f"Auth_type[{dc.auth_type}]"
-                )
-                res_d = dc.authorize_request()
-                res_t = dc.process_authorize_response(res_d)
-                ctx = dc.decode_token(
-                    res_t, ["access_token", "refresh_token"]
-                )
-                self.logger.debug(
-                    f"ConsoleApp.get_snowflake_session(): "\
-                    f"Auth_type[{dc.auth_type}]"
-                )
-                session = self.snow_connect.create_user_session(ctx)
-
-        return session
\ No newline at end of file
+    def _acquire_ctx(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
+        dc: DeviceCodeConnect = self.snow_connect.get_oauth_connect()
+        self.logger.debug(
+            "ConsoleApp._acquire_ctx(): Auth_type[%s]", dc.auth_type
+        )
+        res_d = dc.authorize_request()
+        res_t = dc.process_authorize_response(res_d)
+        return dc.decode_token(res_t, ["access_token", "refresh_token"])
@@ -19,12 +19,10 @@ __version__ = "0.5.0"
 import os
 from os.path import exists
 import sys
-from typing import Optional, Union, Dict, Callable
+from typing import Optional, Union, Dict, Any, Callable
 import logging
 from types import ModuleType
 
-from snowflake.snowpark import Session
-
 from snowflake_ai.common import AppType
 from snowflake_ai.apps import BaseApp
 from snowflake_ai.connect import DeviceCodeConnect
@@ -74,7 +72,7 @@ class NotebookApp(BaseApp):
         """
         super().__init__(app_key, config_dir, config_file)
         self.logger = self._logger
-        if  AppType.Notebook.value != self.type:
+        if self._type_enum is not AppType.Notebook:
             raise TypeError(
                 "NotebookApp.init(): Application type configuration Error!"
             )
@@ -82,25 +80,11 @@ class NotebookApp(BaseApp):
 
 
 
-    def get_snowflake_session(self, ctx: Dict = {}) -> Session:
-        session = None
-        if self.snow_connect is not None:
-            session = self.snow_connect.get_connection()
-            if session is None:
-                dc: DeviceCodeConnect = self.snow_connect.get_oauth_connect()
-                self.logger.debug(
-                    f"NotebookApp.get_snowflake_session(): "\
-                    f"Auth_type[{dc.auth_type}]"
-                )
-                res_d = dc.authorize_request()
-                res_t = dc.process_authorize_response(res_d)
-                ctx = dc.decode_token(
-                    res_t, ["access_token", "refresh_token"]
-                )
-                self.logger.debug(
-                    f"NotebookApp.get_snowflake_session(): "\
-                    f"Auth_type[{dc.auth_type}]"
-                )
-                session = self.snow_connect.create_user_session(ctx)
-
-        return session
\ No newline at end of file
+    def _acquire_ctx(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
+        dc: DeviceCodeConnect = self.snow_connect.get_oauth_connect()
+        self.logger.debug(
+            "NotebookApp._acquire_ctx(): Auth_type[%s]", dc.auth_type
+        )
+        res_d = dc.authorize_request()
+        res_t = dc.process_authorize_response(res_d)
+        return dc.decode_token(res_t, ["access_token", "refresh_token"])
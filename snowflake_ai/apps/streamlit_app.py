@@ -17,22 +17,60 @@ __version__ = "0.5.0"
 
 
 import os
-from os.path import exists
 import sys
-from typing import Optional, Union, Dict, Callable
+from typing import Optional, Union, Dict, Tuple, Callable
 import logging
-import toml
-from functools import wraps
+from hashlib import blake2b
+from functools import lru_cache
 import streamlit as st
 from types import ModuleType
-from snowflake.snowpark import Session
 
 from snowflake_ai.common import AppConfig, AppType, ConfigType
 from snowflake_ai.apps import AppPage, BaseApp
 from snowflake_ai.common import OAuthConnect
 from snowflake_ai.connect import AuthCodeConnect, ConnectManager,\
         SnowConnect
-from snowflake_ai.snowpandas import SetupManager, DataSetup
+
+# buffer size for reading and writing streamlit config file
+_IO_BUFFER_SIZE = 20480
+
+# (conf_path, app_key) : (st_mtime_ns, st_size) of verified config file
+_conf_file_stamps: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+
+
+@lru_cache(maxsize=None)
+def _rendered_streamlit_toml(app_key: str) -> str:
+    # imported on first render; prefer native/faster toml serializers
+    try:
+        from rtoml import dumps as _toml_dumps
+    except ImportError:
+        try:
+            from tomli_w import dumps as _toml_dumps
+        except ImportError:
+            from toml import dumps as _toml_dumps
+
+    # resolved once per app_key for the process, not per rerun instance
+    gk, k = AppConfig.split_group_key(app_key)
+    config: Dict[str, Dict] = AppConfig.get_all_configs().get(
+        ConfigType.Streamlits.value, {}
+    )
+    StreamlitApp._logger.debug(
+        "StreamlitApp.get_streamlit_config(): Group_key [%s]; App_"\
+        "key [%s]; Config [%s].", gk, k, config
+    )
+    return _toml_dumps(config.get(gk, {}).get(k, {}))
+
+
+def _digest(content: bytes) -> bytes:
+    return blake2b(content, digest_size=16).digest()
+
+
+def _file_digest(path: str) -> bytes:
+    with open(path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return _digest(f.read())
 
 
 
@@ -86,18 +124,15 @@ class StreamlitApp(BaseApp):
         """
         super().__init__(app_key, config_dir, config_file)
         self.logger = self._logger
-        if StreamlitApp.T_ST_APP != self.type:
+        if self._type_enum is not AppType.Streamlit:
             raise TypeError(
                 "StreamlitApp.init(): Application type configuration Error."
             )
         self._setup_streamlit_config()
         self.pages : Dict[str, AppPage] = {}
         self.is_logged_in = False
-        self.snow_connect = ConnectManager.create_default_snow_connect(self)
-        self.default_setup = SetupManager.create_default_snow_setup(
-            self, self.snow_connect
-        )
-        self.default_setup.load_module()
+        # snow_connect, default_setup and setup_module are cached across
+        # reruns by ConnectManager, SetupManager and sys.modules
 
 
     def _setup_streamlit_config(
@@ -117,38 +152,46 @@ class StreamlitApp(BaseApp):
         """
         app_dir = os.path.join(self.root_path, self.script_home)
         p = os.path.join(app_dir, ".streamlit/")
-        if not exists(p):
-            try:
-                os.makedirs(p, exist_ok=True)
-            except Exception as e:
-                raise ValueError(
-                    f"Streamlit._setup_streamlit_dir(): Error [{e}] - "\
-                    "Cannot create streamlit configuration directory!"
-                )
+        try:
+            os.makedirs(p, exist_ok=True)
+        except Exception as e:
+            raise ValueError(
+                f"Streamlit._setup_streamlit_dir(): Error [{e}] - "\
+                "Cannot create streamlit configuration directory!"
+            )
 
         if conf_file is None:
             conf_file = "config.toml"
         
         conf_path = os.path.join(p, conf_file)
-
-        if not exists(conf_path):
-            if file_content is None:
-                file_content = self.get_streamlit_config()
-            
-            if file_content:
-                with open(conf_path, "w") as f:
-                    f.write(file_content)
-        else:
-            with open(conf_path, "r") as f:
-                current_content = f.read()
-            
-            if file_content is None:
-                file_content = self.get_streamlit_config()
-            
-            if current_content != file_content:
-                if file_content:
-                    with open(conf_path, "w") as f:
-                        f.write(file_content)
+        # apps may share a script_home, hence the same config file
+        stamp_key = (conf_path, self.app_key)
+        try:
+            st_ = os.stat(conf_path)
+        except FileNotFoundError:
+            st_ = None
+
+        # skip reading the file if unchanged since last verified
+        generated = file_content is None
+        if generated and st_ is not None:
+            stamp = (st_.st_mtime_ns, st_.st_size)
+            if _conf_file_stamps.get(stamp_key) == stamp:
+                return conf_path
+
+        if file_content is None:
+            file_content = self.get_streamlit_config()
+
+        if file_content:
+            new_content = file_content.encode("utf-8")
+            # sizes differ, so no need to read the file at all
+            if st_ is None or st_.st_size != len(new_content) or \
+                    _file_digest(conf_path) != _digest(new_content):
+                with open(conf_path, "wb", buffering=_IO_BUFFER_SIZE) as f:
+                    f.write(new_content)
+                st_ = os.stat(conf_path)
+
+        if generated and st_ is not None:
+            _conf_file_stamps[stamp_key] = (st_.st_mtime_ns, st_.st_size)
 
         return conf_path
 
@@ -157,21 +200,7 @@ class StreamlitApp(BaseApp):
         """
         Get streamlit app configuration from config file
         """
-        # split app_key in form of group_key.app_key into two variables
-        gk, k = AppConfig.split_group_key(self.app_key)
-        config: Dict[str, Dict] = self.get_all_configs().get(
-            ConfigType.Streamlits.value, {}
-        )
-        self.logger.debug(
-            f"StreamlitApp.get_streamlit_config(): Group_key [{gk}]; App_"\
-            f"key [{k}]; Config [{config}]."
-        )
-        if config:
-            config = config.get(gk, {})
-            if config:
-                config = config.get(k, {})
-        
-        return toml.dumps(config)
+        return _rendered_streamlit_toml(self.app_key)
     
 
     def add_page(self, page:AppPage):
@@ -208,25 +237,23 @@ class StreamlitApp(BaseApp):
         show_sidebar: Optional[bool] = True,
     ) -> Callable:
         def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                return func(*args, **kwargs)
-
             self._add_page(
                 page_id=page_id,
                 title=title,
                 icon=icon,
                 layout=layout,
                 show_sidebar=show_sidebar,
-                func=wrapper,
+                func=func,
             )
-            return wrapper
+            return func
 
         return decorator
     
 
     def set_pages_config(self):
-        for _, pg in self.pages.items():
+        # streamlit accepts one page config per run, i.e., current page's
+        pg: AppPage = self.pages.get(self.get_current_page())
+        if pg:
             st.set_page_config(
                 page_title = pg.title,
                 page_icon = pg.icon ,
@@ -243,9 +270,9 @@ class StreamlitApp(BaseApp):
     def navigate_to(self, page_id: str):
         previous_page_id = self.get_current_page()
         st.experimental_set_query_params(
-            previous_page = previous_page_id
+            previous_page = previous_page_id,
+            page = page_id
         )
-        st.experimental_set_query_params(page=page_id)
         self.run()
 
 
@@ -270,6 +297,15 @@ class StreamlitApp(BaseApp):
         return oc.authorize_request(params)
 
 
+    def _render_welcome(self, tok: Optional[Dict]):
+        if not tok:
+            return
+        fnm = tok.get("given_name")
+        lnm = tok.get("family_name")
+        if fnm or lnm:
+            st.sidebar.write(f"Welcome, {fnm or ''} {lnm or ''}!")
+
+
     def request_access_token(
         self,
         oc: OAuthConnect,
@@ -282,19 +318,19 @@ class StreamlitApp(BaseApp):
         if auth_cd is not None and auth_cd:
             tok_res = oc.grant_request(params)
             self.logger.debug(
-                f"StreamlitApp.request_access_token(): "\
-                f"Token result - [{tok_res}]"
+                "StreamlitApp.request_access_token(): "\
+                "Token result - [%s]", tok_res
             )
-            print()
             if tok_res:
-                dc = ConnectManager.create_default_snow_connect(self)
+                dc = self.get_default_snow_connect()
                 ctx = oc.decode_token(
                     tok_res, ["access_token", "refresh_token"]
                 )
-                self.logger.debug(
-                    f"StreamlitApp.request_access_token(): "\
-                    f"Decode token, Context [{ctx.items()}]"
-                )                
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "StreamlitApp.request_access_token(): "\
+                        "Decode token, Context [%s]", ctx.items()
+                    )                
                 session = dc.create_session(ctx)
                 if ap is not None:
                     ap.session = session
@@ -302,13 +338,7 @@ class StreamlitApp(BaseApp):
                         f"StreamlitApp.request_access_token(): "\
                         f"Creation of snowflake session [OK]"
                     )
-                tok: Dict = ctx.get("decoded_access_token")
-                if tok:
-                    fnm = tok.get("given_name", "")
-                    lnm = tok.get("family_name", "")
-                    st.sidebar.write(
-                        f"Welcome, {fnm} {lnm}!"
-                    )
+                self._render_welcome(ctx.get("decoded_access_token"))
                 ok = True
         if not ok:
             st.error("Authorization failed.")
@@ -329,11 +359,11 @@ class StreamlitApp(BaseApp):
         if  refresh_tok is not None and refresh_tok:
             tok_res = oc.refresh_token_request(params)
             self.logger.debug(
-                f"StreamlitApp.request_refresh_token(): "\
-                f"Refersh token result- [{tok_res}]"
+                "StreamlitApp.request_refresh_token(): "\
+                "Refersh token result- [%s]", tok_res
             )              
             if tok_res:
-                dc = ConnectManager.create_default_snow_connect(self)
+                dc = self.get_default_snow_connect()
                 ctx = oc.decode_token(
                     tok_res, ["access_token", "refresh_token"]
                 )
@@ -350,13 +380,7 @@ class StreamlitApp(BaseApp):
                         f"Creation snowflake session [OK]"
                     )
 
-                tok: Dict = ctx.get("decoded_access_token")
-                if tok:
-                    fnm = tok.get("given_name", "")
-                    lnm = tok.get("family_name", "")
-                    st.sidebar.write(
-                        f"Welcome, {fnm} {lnm}!"
-                    )
+                self._render_welcome(ctx.get("decoded_access_token"))
                 ok = True
         if not ok:
             st.error("Authorization failed.")
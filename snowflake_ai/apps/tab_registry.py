@@ -17,7 +17,6 @@ __version__ = "0.5.0"
 
 
 from typing import Optional, List, Dict, Callable
-from functools import wraps
 import logging
 
 from snowflake.snowpark.session import Session
@@ -43,6 +42,8 @@ class PageTab:
         ...
         >>> home_page = AppPage("home", "Home", page_home)
     """
+    __slots__ = ("tab_id", "func", "_tab", "title")
+
     _logger = logging.getLogger(__name__)
 
     def __init__(
@@ -89,7 +90,8 @@ class TabRegistry:
     A registry for managing tabs in a multi-page application.
 
     Attributes:
-        tabs (List[PageTab]): A list of PageTab instances.
+        tab_list (List[PageTab]): PageTab instances in registration order.
+        tabs (Dict[str, PageTab]): PageTab instances keyed by tab id.
 
     Example:
         >>> hp = HomePage()
@@ -102,9 +104,10 @@ class TabRegistry:
     _logger = logging.getLogger(__name__)
 
     def __init__(self):
-        self.tab_list: List[PageTab] = []
-        self.tab_funcs: List[Callable] = []
+        # tab_id : PageTab, with tabs and ids in registration order
         self.tabs: Dict[str, PageTab] = {}
+        self.tab_list: List[PageTab] = []
+        self._ids: List[str] = []
 
 
     def register(
@@ -121,7 +124,7 @@ class TabRegistry:
                 navigation. Defaults to None.
 
         Returns:
-            Callable: The wrapped page tab function.
+            Callable: The registered page tab function.
 
         Example:
             >>> registry = TabRegistry()
@@ -132,14 +135,16 @@ class TabRegistry:
         """
 
         def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                return func(*args, **kwargs)
-
-            pt = PageTab(tab_id, wrapper, None, title)
-            self.tab_list.append(pt)
-            self.tab_funcs.append(func)
-            return wrapper
+            pt = PageTab(tab_id, func, None, title)
+            old = self.tabs.get(tab_id)
+            if old is None:
+                self.tab_list.append(pt)
+                self._ids.append(tab_id)
+            else:
+                # re-registered tab id replaces its earlier tab in place
+                self.tab_list[self.tab_list.index(old)] = pt
+            self.tabs[tab_id] = pt
+            return func
 
         return decorator
 
@@ -152,16 +157,7 @@ class TabRegistry:
         Return:
             dict: PageTab object ditionary
         """
-        ids = [t.tab_id for t in self.tab_list]
-        tbs = st.tabs(ids)
-
-        td = dict(zip(ids, tbs))
-        rd = {}
-
-        for pt in self.tab_list:
-            if pt.get_tab() is None and pt.tab_id in td:
-                pt.set_tab(td[pt.tab_id])
-                rd[pt.tab_id] = pt
+        for pt, tb in zip(self.tab_list, st.tabs(self._ids)):
+            pt.set_tab(tb)
 
-        self.tabs = rd
-        return rd
\ No newline at end of file
+        return self.tabs
@@ -19,15 +19,25 @@ __version__ = "0.5.0"
 
 from enum import Enum
 import os
+import stat
 import sys
-from os.path import exists
+import threading
 from pathlib import Path
 from types import ModuleType
-from typing import Optional, Union, Dict, Tuple, Any
+from typing import Optional, Union, Dict, Tuple, Any, NamedTuple
 import logging
-import toml
 import importlib
-from importlib.resources import read_text
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+try:
+    from importlib.resources import files as resource_files
+except ImportError:
+    from importlib_resources import files as resource_files
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
 
 
 
@@ -55,6 +65,32 @@ class AppType(Enum):
 
 
 
+@lru_cache(maxsize=1024)
+def _split_group_key(key: str) -> Tuple[str, str]:
+    group_k, sep, k = key.strip().lower().partition('.')
+    if not sep:
+        return ('', group_k)
+    # only the segment after group is the key, e.g., "g.k.x" -> ("g", "k")
+    return (group_k, k.partition('.')[0])
+
+
+
+def _normalize_keys(d: Dict) -> Dict:
+    # root section keys are matched case insensitively, like the merge of
+    # multiple toml files always did; nested keys are kept as written
+    return {
+        sys.intern(k.strip().lower()) if isinstance(k, str) else k: v
+        for k, v in d.items()
+    }
+
+
+
+class AppNamespaces(NamedTuple):
+    namespace: str
+    name: str
+
+
+
 class ConfigKey(Enum):
     APP_NAME = "app_name"
     NAME = "name"
@@ -88,6 +124,28 @@ class ConfigKey(Enum):
 
 
 
+# plain values of enum members read on every AppConfig construction
+_CK_APP_NAME = ConfigKey.APP_NAME.value
+_CK_APP_PATH = ConfigKey.APP_PATH.value
+_CK_APP_SHORT_NAME = ConfigKey.APP_SHORT_NAME.value
+_CK_DOMAIN_ENV = ConfigKey.DOMAIN_ENV.value
+_CK_NAME = ConfigKey.NAME.value
+_CK_ROOT_PATH = ConfigKey.ROOT_PATH.value
+_CK_SCRIPT_HOME = ConfigKey.SCRIPT_HOME.value
+_CK_TYPE = ConfigKey.TYPE.value
+_CK_VERSION = ConfigKey.VERSION.value
+_CT_APPS = ConfigType.Apps.value
+_CT_APP_CONNECTS = ConfigType.AppConnects.value
+_CT_BASE_APPS = ConfigType.BaseApps.value
+_CT_DATA_CONNECTS = ConfigType.DataConnects.value
+_CT_DATA_SETUPS = ConfigType.DataSetups.value
+_CT_ML_OPS = ConfigType.MLOps.value
+_CT_ML_PIPELINES = ConfigType.MLPipelines.value
+_CT_OAUTH_CONNECTS = ConfigType.OAuthConnects.value
+_AT_DEFAULT = AppType.Default.value
+
+
+
 class AppConfig:
     """
     This class represents the overall enterprise ai/ml application 
@@ -144,23 +202,36 @@ class AppConfig:
     T_REG_TBL_DEF = "default_model_registry"
 
 
-    logging.basicConfig(
-        level=logging.ERROR,
-        format='%(asctime)s [%(levelname)s]  %(message)s'
-    )
     _logger = logging.getLogger(__name__)
 
     # only init one in runtime
     _initialized = False
+    _init_lock = threading.Lock()
     _configs_root = ''
     _configs_path = ''
 
     # store all configs at class level
     _configs: Dict[str, Dict] = {}
 
+    # valid root (top level) section keys of configs
+    _root_keys = frozenset(t.value for t in ConfigType)
+
     # store appconfig ref by specific app key at class level
     _apps = {}
 
+    # (config_dir, config_file, file mtimes) : loaded configs
+    _toml_cache: Dict[Tuple, Dict] = {}
+    _default_configs: Optional[Dict] = None
+
+    # root_key : { item_key : (group_key.item_key, item config) }
+    _key_index: Dict[str, Dict[str, Tuple[str, Any]]] = {}
+
+    # (top_key, group_key) : filtered group section of configs
+    _filtered_group_cache: Dict[Tuple[str, str], Dict] = {}
+
+    # (root_key, key) : qualified group_key.item_key of configs
+    _qualified_key_cache: Dict[Tuple[str, str], str] = {}
+
     # init lib load system path
     _init_lib_path = False
 
@@ -185,24 +256,27 @@ class AppConfig:
         self.app_key = app_key.strip().lower()
 
         # init all configs and configs dict
-        self.root_path = AppConfig._init_all_configs(config_dir, config_file)
+        self.root_path, _, configs = AppConfig._ensure_loaded(
+                config_dir, config_file)
 
         # get group_key.app_name , [apps.<group_key>.<app_name>] app config
         self.app_key, self.app_config = AppConfig.load_app_config(
-                self.app_key)
-        self.app_name = self.app_config.get(ConfigKey.APP_NAME.value,
+                self.app_key, configs)
+        self.app_name = self.app_config.get(_CK_APP_NAME,
                 self.app_key.lower().replace('.', '_') )
         self.app_group = AppConfig.split_group_key(self.app_key)[0]
+        ns = self.app_key.rsplit('.', 1) if self.app_key else ["", ""]
+        self._app_namespaces = AppNamespaces(*ns) if len(ns) > 1 \
+                else AppNamespaces("", ns[0])
         self.app_short_name = self.app_config.get(
-                ConfigKey.APP_SHORT_NAME.value, 
+                _CK_APP_SHORT_NAME, 
                 self.app_key.lower().replace('.', '_')
             )
 
         # init config dict, set app global attrs, app type, and root path
-        self.type =  AppConfig._configs[ConfigType.Apps.value].get(
-                ConfigKey.TYPE.value, AppType.Default.value)
-        self.root_path =  AppConfig._configs[ConfigType.Apps.value].get(
-                ConfigKey.ROOT_PATH.value, 
+        apps_top: Dict = configs[_CT_APPS]
+        self.type = apps_top.get(_CK_TYPE, _AT_DEFAULT)
+        self.root_path = apps_top.get(_CK_ROOT_PATH, 
                 os.path.abspath(AppConfig.DEF_CURR_PATH))
 
         # initialize additional app specific attrs, e.g., name, type, path
@@ -211,38 +285,37 @@ class AppConfig:
             self._apps[self.app_key] = self
 
         self.logger.debug(
-                f"AppConfig.init(): App_name [{self.app_name}]; "\
-                f"App_group [{self.app_group}]; Root_path [{self.root_path}]"\
-                f"; Script_home [{self.script_home}]") 
+                "AppConfig.init(): App_name [%s]; App_group [%s]; "\
+                "Root_path [%s]; Script_home [%s]", self.app_name,
+                self.app_group, self.root_path, self.script_home)
         
         # get base app config
         _, self.app_base_config = AppConfig.get_group_item_config(
-                self.app_key, ConfigType.BaseApps.value, self._configs)
+                self.app_key, _CT_BASE_APPS, configs)
         self.logger.debug(
-                f"AppConfig.init(): BaseAppConfigs => "\
-                f"{self.app_base_config}.")        
+                "AppConfig.init(): BaseAppConfigs => %s.",
+                self.app_base_config)        
         self.app_connect_refs = self.app_base_config.get(
-                ConfigType.AppConnects.value, [])
+                _CT_APP_CONNECTS, [])
         self.ml_ops_refs = self.app_base_config.get(
-                ConfigType.MLOps.value, [])
+                _CT_ML_OPS, [])
         self.data_setup_refs = self.app_base_config.get(
-                ConfigType.DataSetups.value, [])        
+                _CT_DATA_SETUPS, [])        
         self.ml_pipeline_refs = self.app_base_config.get(
-                ConfigType.MLPipelines.value, [])
-        self.logger.debug(f"AppConfig.init(): App_key [{self.app_key}]; "\
-                f"App_connect_ref [{self.app_connect_refs}]; "\
-                f"Data_setup_ref [{self.data_setup_refs}]")
+                _CT_ML_PIPELINES, [])
+        self.logger.debug("AppConfig.init(): App_key [%s]; "\
+                "App_connect_ref [%s]; Data_setup_ref [%s]", self.app_key,
+                self.app_connect_refs, self.data_setup_refs)
 
         # get oauth and data connect configs groups
-        d_conn: Dict = AppConfig._configs.get(
-                ConfigType.AppConnects.value)
+        d_conn: Dict = configs.get(_CT_APP_CONNECTS)
         self.oauth_connect_configs: Dict = {}
         if d_conn is not None:
-            d_oauth_conn = d_conn.get(ConfigType.OAuthConnects.value)
+            d_oauth_conn = d_conn.get(_CT_OAUTH_CONNECTS)
             self.oauth_connect_configs = d_oauth_conn
         self.data_connect_configs: Dict  = {}
         if d_conn is not None:
-            d_data_conn = d_conn.get(ConfigType.DataConnects.value)
+            d_data_conn = d_conn.get(_CT_DATA_CONNECTS)
             self.data_connect_configs = d_data_conn
         
 
@@ -270,73 +343,40 @@ class AppConfig:
         Raises:
             ValueError: If config root, config file or path doesn't exist.
         """
-        config_rt = None
-        if (config_dir is None) or (not config_dir):
-            config_rt = AppConfig.DEF_CURR_PATH
-            config_dir = AppConfig.DEF_CONF_DIR
-        configs = AppConfig._load_toml_files(config_dir, config_file)
-        if config_rt != AppConfig.DEF_CURR_PATH:
-            config_rt = config_dir
-        if config_rt:
-            config_rt = os.path.abspath(config_rt)
-        AppConfig._logger.debug(
-            f"AppConfig.load_configs(): Load from input default directory"\
-            f" - Current_root_dir [{config_rt}]; Config_dir [{config_dir}]."
-        )
-
-        home = Path.home()
-        if not configs:
-            config_rt = os.path.abspath(home)
-            config_dir = os.path.join(home, AppConfig.DEF_CONF_DIR)
-            configs = AppConfig._load_toml_files(config_dir, config_file)
-            AppConfig._logger.debug(
-                f"AppConfig.load_configs(): Load from home default directory"\
-                f" - Home [{home}]; Config_root [{config_rt}]; "\
-                f"Config_dir [{config_dir}]."
-            )
-        
-        if not configs:
-            config_rt = os.path.abspath(AppConfig.DEF_CURR_PATH)
-            config_dir = config_rt
+        home = os.path.abspath(Path.home())
+        curr = os.path.abspath(AppConfig.DEF_CURR_PATH)
+        candidates = [
+            (curr, AppConfig.DEF_CONF_DIR),
+            (home, os.path.join(home, AppConfig.DEF_CONF_DIR)),
+            (curr, curr),
+            (home, home)
+        ]
+        if (config_dir is not None) and config_dir:
+            candidates[0] = (os.path.abspath(config_dir), config_dir)
+
+        for config_rt, config_dir in candidates:
             configs = AppConfig._load_toml_files(config_dir, config_file)
+            loaded = bool(configs)
             AppConfig._logger.debug(
-                f"AppConfig.load_configs(): Load from input directory "\
-                f"after home default check - Config_root [{config_rt}];"\
-                f" Config_dir [{config_dir}]."
-            )
-        
-        if not configs:
-            config_rt = os.path.abspath(home)
-            config_dir = config_rt
-            configs = AppConfig._load_toml_files(config_dir, config_file)        
-            AppConfig._logger.debug(
-                f"AppConfig.load_configs(): Load from home directory "\
-                f"directly - Home [{home}]; Config_root [{config_rt}];"\
-                f" Config_dir [{config_dir}]."
+                "AppConfig.load_configs(): Load from bootstrap directory"\
+                " - Config_root [%s]; Config_dir [%s]; Loaded [%s].",
+                config_rt, config_dir, loaded
             )
-        
-        if not configs:
+            if loaded:
+                break
+        else:
             config_dir = AppConfig.DEF_CONF_LIB_PATH
             configs = AppConfig.load_default_configs()
             AppConfig._logger.debug(
-                f"AppConfig.load_configs(): Load from library default "\
-                f"directory - Config_root [{config_rt}];"\
-                f" Config_dir [{config_dir}]."
-            )
-        
-        if (config_rt is not None) and config_rt:
-            config_rt =  os.path.abspath(config_rt)
-            AppConfig._logger.debug(
-                f"AppConfig.load_configs(): Output current configuration"\
-                f" bootstrap path - Config_root [{config_rt}];"\
-                f" Config_dir [{config_dir}]."
+                "AppConfig.load_configs(): Load from library default "\
+                "directory - Config_root [%s]; Config_dir [%s].",
+                config_rt, config_dir
             )
-        
-        if (config_rt is None) or (not exists(config_rt)):
-            s = f"AppConfig.load_configs(): Error - config_root "\
-                    f"[{config_rt}] doesn't exist!"
-            AppConfig._logger.error(s)
-            raise ValueError(s)
+            if not os.path.exists(config_rt):
+                s = f"AppConfig.load_configs(): Error - config_root "\
+                        f"[{config_rt}] doesn't exist!"
+                AppConfig._logger.error(s)
+                raise ValueError(s)
 
         return (config_rt, config_dir, configs)
 
@@ -347,13 +387,16 @@ class AppConfig:
         config_file : Optional[str] = None
     ) -> Dict:
         rd = {}
-        files_tsd = {}
         toml_files = [] if config_file is None else [config_file]
 
         if (config_dir is not None) and (config_dir.strip()):
             config_dir = os.path.abspath(config_dir.strip())
 
-        if not exists(config_dir):
+        try:
+            is_dir = stat.S_ISDIR(os.stat(config_dir).st_mode)
+        except (OSError, TypeError):
+            is_dir = False
+        if not is_dir:
             AppConfig._logger.warning(
                 f"AppConfig._load_toml_files(): Directory [{config_dir}]"\
                 " doesn't exist!"
@@ -362,53 +405,92 @@ class AppConfig:
 
         if (config_file is not None) and bool(config_file.strip()):
             config_file_path = os.path.join(config_dir, config_file)
-            with open(config_file_path, 'r') as f:
-                try:
-                    rd = toml.load(f)
-                except Exception as e:
-                    raise ValueError(
-                        f"AppConfig._load_toml_files(): Cannot load "\
-                        f"file [{config_file_path}], check format! "\
-                        f"Error - {e}!"
-                    )
+            st = os.stat(config_file_path)
+            cache_key = (config_dir, config_file, st.st_mtime)
+            rd = AppConfig._toml_cache.get(cache_key)
+            if rd is not None:
+                return rd
+            try:
+                rd = AppConfig._read_toml(config_file_path)
+            except Exception as e:
+                raise ValueError(
+                    f"AppConfig._load_toml_files(): Cannot load "\
+                    f"file [{config_file_path}], check format! "\
+                    f"Error - {e}!"
+                ) from e
+            AppConfig._toml_cache[cache_key] = rd
             return rd
         else:
-            toml_files = [
-                f for f in os.listdir(config_dir) \
-                    if f.lower().endswith(".toml")
-            ]
-            for toml_file in toml_files:
-                config_file_path = os.path.join(config_dir, toml_file)
-                with open(config_file_path, 'r') as f:
-                    try:
-                        toml_dict = toml.load(f)
-                    except Exception as e:
-                        raise ValueError(
-                            f"AppConfig._load_toml_files(): Cannot load "\
-                            f"list of files from [{config_file_path}], "\
-                            f" check format! Error - {e}!"
-                        )
-                file_ts = os.path.getmtime(config_file_path)
-                config_file = config_file_path
-
-                for key, value in toml_dict.items():
-                    key = key.strip().lower()
-                    if key not in rd or file_ts > files_tsd[key]:
-                        rd[key] = value
-                        files_tsd[key] = file_ts
+            with os.scandir(config_dir) as it:
+                entries = [
+                    (e.name, e.path, e.stat()) for e in it \
+                        if e.name.lower().endswith(".toml") and e.is_file()
+                ]
+            toml_files = [e[0] for e in entries]
+            # skip reading and parsing when no toml file has changed
+            cache_key = (config_dir, None,
+                    tuple((nm, st.st_mtime) for nm, _, st in entries))
+            cached = AppConfig._toml_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            # parse concurrently, then merge oldest first so that a root
+            # section is taken from the most recently modified file
+            entries.sort(key=lambda e: e[2].st_mtime)
+            if len(entries) >= 3:
+                with ThreadPoolExecutor(
+                        max_workers=min(8, len(entries))) as executor:
+                    toml_dicts = list(executor.map(
+                        AppConfig._read_toml_entry, entries))
+            else:
+                toml_dicts = [AppConfig._read_toml_entry(e) for e in entries]
+            for toml_dict in toml_dicts:
+                if toml_dict is not None:
+                    rd.update(toml_dict)
+            AppConfig._toml_cache[cache_key] = rd
 
         AppConfig._logger.info(
-            f"DataConnect._load_toml_files(): Loaded configuration from "\
-            f"directory [{config_dir}]; Loaded files => {toml_files};"\
-            f" Configuration keys => {rd.keys()}."
+            "AppConfig._load_toml_files(): Loaded configuration from "\
+            "directory [%s]; Loaded files => %s; Configuration keys => %s.",
+            config_dir, toml_files, list(rd.keys())
         )
         AppConfig._logger.debug(
-            f"DataConnect._load_toml_files(): Loaded configuration from "\
-            f"path [{config_dir}]; Detailed App_config [{rd}]."
+            "AppConfig._load_toml_files(): Loaded configuration from "\
+            "path [%s]; Detailed App_config [%s].", config_dir, rd
         )
         return rd
 
 
+    @staticmethod
+    def _read_toml(path: str) -> Dict:
+        """
+        Parse a toml file.
+
+        Args:
+            path (str): toml file path
+
+        Returns:
+            dict: parsed toml file content with normalized section keys
+        """
+        with open(path, 'rb') as f:
+            return _normalize_keys(tomllib.load(f))
+
+
+    @staticmethod
+    def _read_toml_entry(
+        entry: Tuple[str, str, os.stat_result]
+    ) -> Optional[Dict]:
+        # a bad file among many is skipped rather than failing the load
+        _, config_file_path, st = entry
+        try:
+            return AppConfig._read_toml(config_file_path)
+        except Exception as e:
+            AppConfig._logger.warning(
+                "AppConfig._load_toml_files(): Skip file [%s], check "\
+                "format! Error - %s!", config_file_path, e
+            )
+            return None
+
+
     @staticmethod
     def load_default_configs() -> Dict:
         """
@@ -417,15 +499,16 @@ class AppConfig:
         Returns:
             dict: loaded configuration as a dictionary
         """
-        config_file = read_text(
-            AppConfig.DEF_CONF_LIB_PATH, 
-            AppConfig.DEF_CONF_FILE
-        )   
-        configs = toml.loads(config_file)
+        if AppConfig._default_configs is not None:
+            return AppConfig._default_configs
+        with resource_files(AppConfig.DEF_CONF_LIB_PATH)\
+                .joinpath(AppConfig.DEF_CONF_FILE).open('rb') as f:
+            configs = _normalize_keys(tomllib.load(f))
         AppConfig._logger.debug(
-            f"AppConfig.load_default_configs(): Loaded default app"\
-            f"configuration; Config keys [{configs.keys()}]."
+            "AppConfig.load_default_configs(): Loaded default app "\
+            "configuration; Config keys [%s].", list(configs.keys())
         )
+        AppConfig._default_configs = configs
         return configs
     
 
@@ -451,7 +534,7 @@ class AppConfig:
             configuration section corresponding to the group_item_key.
         """
         root_key = root_key.strip().lower() if root_key \
-                else ConfigType.Apps.value
+                else _CT_APPS
         if configs is not None and \
                 configs.get(root_key) is None:
             s = f"AppConfig.get_group_item_config(): Error "\
@@ -463,11 +546,10 @@ class AppConfig:
             configs = AppConfig.get_all_configs()
 
         rd = {}
-        gp_itm_key = group_item_key.strip().lower()
-        gk, ik = AppConfig.split_group_key(gp_itm_key)
+        gk, ik = AppConfig.split_group_key(group_item_key)
         AppConfig._logger.debug(
-            f"AppConfig.get_group_item_config(): Split key - "\
-            f"GroupKey [{gk}]; ItemKey[{ik}]."
+            "AppConfig.get_group_item_config(): Split key - "\
+            "GroupKey [%s]; ItemKey[%s].", gk, ik
         )
         if (not gk) and ik:
             k, rd = AppConfig.search_key_by_group(
@@ -480,21 +562,21 @@ class AppConfig:
                 gk, root_key, configs
             )
         else:
-            gs: Dict[str, Dict] = dict(configs[root_key]).get(gk)
+            gs: Dict[str, Dict] = configs[root_key].get(gk)
             if gs is not None:
                 k = f"{gk}.{ik}"
                 rd =  gs[ik] if gs.get(ik) is not None else {}
                 AppConfig._logger.debug(
-                    f"AppConfig.get_group_item_config(): Root_key"\
-                    f"[{root_key}]; GroupKey [{gk}]; "\
-                    f"ItemConfigs [{gs}]; ItemKey[{ik}]; Config => {rd}."
+                    "AppConfig.get_group_item_config(): Root_key"\
+                    "[%s]; GroupKey [%s]; ItemConfigs [%s]; ItemKey[%s]"\
+                    "; Config => %s.", root_key, gk, gs, ik, rd
                 )
             else:
                 k, rd =  f"{gk}.{ik}", {}
 
         AppConfig._logger.debug(
-            f"AppConfig.get_group_item_config(): Loaded group item "\
-            f"configration with key [{k}]; Config => {rd}."
+            "AppConfig.get_group_item_config(): Loaded group item "\
+            "configration with key [%s]; Config => %s.", k, rd
         )
         return (k, rd)
 
@@ -519,7 +601,7 @@ class AppConfig:
         """
         return AppConfig.get_group_item_config(
                 app_key,
-                ConfigType.Apps.value,
+                _CT_APPS,
                 configs
             )
 
@@ -547,11 +629,24 @@ class AppConfig:
         if top_key not in configs or group_key not in configs[top_key]:
             return {}
 
+        # only sections of class level configs are cached
+        cached = configs is AppConfig._configs
+        if cached:
+            filtered_dict = AppConfig._filtered_group_cache.get(
+                    (top_key, group_key))
+            if filtered_dict is not None:
+                # callers own the returned dict, keep the cached one intact
+                return dict(filtered_dict)
+
         group_dict: dict = configs[top_key][group_key]
 
         filtered_dict = {k: v for k, v in group_dict.items() \
             if not isinstance(v, dict)}
 
+        if cached:
+            AppConfig._filtered_group_cache[(top_key, group_key)] = \
+                    filtered_dict
+            return dict(filtered_dict)
         return filtered_dict
 
 
@@ -573,6 +668,15 @@ class AppConfig:
             A tuple containing the group_key.key and dict of matched
             key section.
         """
+        if configs is AppConfig._configs:
+            # index of a root section is built on its first search
+            key_index = AppConfig._key_index.get(top_key)
+            if key_index is None:
+                key_index = AppConfig._build_key_index(
+                        configs.get(top_key, {}))
+                AppConfig._key_index[top_key] = key_index
+            return key_index.get(key, ('', {}))
+
         if top_key not in configs:
             return '',  {}
 
@@ -595,6 +699,39 @@ class AppConfig:
             return first_match
 
 
+    @staticmethod
+    def _build_key_index(config_groups: Dict) -> Dict[str, Tuple]:
+        """
+        Build index of all item keys of a root section with structure of
+        { group_key: { key: {} } }, resolved the same way as
+        search_key_by_group, i.e., default group first then first match.
+
+        Args:
+            config_groups (Dict): Group sections under a top_key
+
+        Returns:
+            A dict of key to tuple of group_key.key and dict of matched
+            key section.
+        """
+        first_d, default_d = {}, {}
+        if not isinstance(config_groups, dict):
+            return first_d
+        for group_key in sorted(config_groups.keys()):
+            group_dict = config_groups[group_key]
+            if not isinstance(group_dict, dict):
+                continue
+            is_default = (AppConfig.T_DEF in group_key) or \
+                    (AppConfig.T_DEFAULT in group_key)
+            for key, value in group_dict.items():
+                match = f"{group_key}.{key}", value
+                if is_default:
+                    default_d[key] = match
+                else:
+                    first_d.setdefault(key, match)
+        first_d.update(default_d)
+        return first_d
+
+
     @staticmethod
     def split_group_key(key: str) -> Tuple[str, str]:
         """
@@ -610,15 +747,7 @@ class AppConfig:
         """
         if key is None:
             return '', ''
-        key = key.strip().lower()
-        split_keys = key.split('.')
-        if len(split_keys) > 1:
-            group_k = split_keys[0]
-            k = split_keys[1]
-        else:
-            k = split_keys[0]
-            group_k = ''
-        return (group_k, k)
+        return _split_group_key(key)
 
 
     @staticmethod
@@ -643,14 +772,14 @@ class AppConfig:
             AppConfig._init_lib_path = True
 
         AppConfig._logger.debug(
-            f"AppConfig.load_module(): Load [{script_name}] "\
-            f"from root_path[{root_path}]/script_home[{script_home}]."
+            "AppConfig.load_module(): Load [%s] from root_path[%s]"\
+            "/script_home[%s].", script_name, root_path, script_home
         )
         module = None
         try:
             module = importlib.import_module(script_name)
             AppConfig._logger.debug(
-                f"AppConfig.load_module(): Module [{script_name}] loaded!"
+                "AppConfig.load_module(): Module [%s] loaded!", script_name
             )
         except Exception as e:
             AppConfig._logger.error(
@@ -669,11 +798,14 @@ class AppConfig:
         Returns:
             A string representing a fully qualified key in config dict.
         """
-        if root_key not in ConfigType._value2member_map_:
+        if root_key not in AppConfig._root_keys:
             raise ValueError(
                 f"AppConfig.get_qualified_key(): Error - [{key}] not found!"
             )
-        
+
+        ret_k = AppConfig._qualified_key_cache.get((root_key, key))
+        if ret_k is not None:
+            return ret_k
         gk, k = AppConfig.split_group_key(key)
         if k:
             configs: dict = AppConfig.get_all_configs()
@@ -683,43 +815,45 @@ class AppConfig:
                     f"AppConfig.get_qualified_key(): Error - Key Empty!"
                 )
             else:
-                g_dict = dict(configs[root_key]).get(gk)
+                g_dict = configs[root_key].get(gk)
                 if g_dict is not None:
                     ret_k = f"{gk}.{k}"
         else:
             raise ValueError(
                 f"AppConfig.get_qualified_key(): Error with key [{key}]!"
             )
+        AppConfig._qualified_key_cache[(root_key, key)] = ret_k
         return ret_k
 
 
 
     def _init_app_base_config(self):
+        get = self.app_config.get
+
         # get app long name and group config
-        self.name = self.app_config.get(ConfigKey.NAME.value)
+        self.name = get(_CK_NAME)
         self.group_config = AppConfig.filter_group_key(
-            self.app_group, ConfigType.Apps.value, self.get_all_configs()
+            self.app_group, _CT_APPS, AppConfig._configs
         )
 
-        s = self.app_config.get(ConfigKey.TYPE.value)
+        s = get(_CK_TYPE)
         if s is not None and s:
             self.type = s
         elif self.type is None or not self.type:
-            self.type = AppType.Default.value
-        self.version = self.app_config.get(ConfigKey.VERSION.value)
-        self.domain_env = self.app_config.get(ConfigKey.DOMAIN_ENV.value)
+            self.type = _AT_DEFAULT
+        self.version = get(_CK_VERSION)
+        self.domain_env = get(_CK_DOMAIN_ENV)
 
         # app and root path (for app deployment)
-        self.app_path = self.app_config.get(ConfigKey.APP_PATH.value, 
-                AppConfig.DEF_CURR_PATH)
-        s = self.app_config.get(ConfigKey.ROOT_PATH.value)
+        self.app_path = get(_CK_APP_PATH, AppConfig.DEF_CURR_PATH)
+        s = get(_CK_ROOT_PATH)
         if s is not None and s:
             self.root_path = s
         if self.root_path is None or not self.root_path:
             self.root_path = ""
 
         # set app script home path dir (for all app related scripts)
-        self.script_home = self.app_config.get(ConfigKey.SCRIPT_HOME.value,
+        self.script_home = get(_CK_SCRIPT_HOME,
                  AppConfig.DEF_CURR_PATH)
 
 
@@ -735,13 +869,44 @@ class AppConfig:
         Returns:
             The root directory path where the configs are loaded from.
         """        
-        if not cls._initialized:
-            cls._configs_root, cls._configs_path, cls._configs = \
-                AppConfig.load_configs(config_dir, config_file)
-            cls._initialized = True
+        if cls._initialized:
+            return cls._configs_root
+        with cls._init_lock:
+            # another thread may have loaded configs while waiting
+            if not cls._initialized:
+                # default root logging once configs are first used rather
+                # than on import; a no-op if the app configured logging
+                logging.basicConfig(
+                    level=logging.ERROR,
+                    format='%(asctime)s [%(levelname)s]  %(message)s'
+                )
+                cls._configs_root, cls._configs_path, cls._configs = \
+                    AppConfig.load_configs(config_dir, config_file)
+                cls._key_index = {}
+                cls._filtered_group_cache.clear()
+                cls._qualified_key_cache.clear()
+                cls._initialized = True
         return cls._configs_root
 
     
+    @classmethod
+    def _ensure_loaded(
+        cls,
+        config_dir : Optional[Union[str, None]] = None, 
+        config_file : Optional[Union[str, None]] = None
+    ) -> Tuple[str, str, Dict]:
+        """
+        Initialize all application configurations if not yet loaded.
+
+        Returns:
+            Tuple[str, str, Dict]: config root dir path, dir path from
+                where the configurations are loaded, and the dict of all
+                loaded configurations.
+        """
+        cls._init_all_configs(config_dir, config_file)
+        return cls._configs_root, cls._configs_path, cls._configs
+
+
     @classmethod
     def get_configs_root(cls) -> str:
         """
@@ -751,9 +916,7 @@ class AppConfig:
             str: root path string of directory containing all 
                 configuration files.
         """
-        if not cls._configs_root:
-            cls._configs_root = cls._init_all_configs()
-        return cls._configs_root
+        return cls._ensure_loaded()[0]
     
 
     @classmethod
@@ -765,9 +928,7 @@ class AppConfig:
             str: path string of directory containing all 
                 configuration files.
         """
-        if not cls._configs_path:
-            cls._init_all_configs()
-        return cls._configs_path
+        return cls._ensure_loaded()[1]
     
 
     @classmethod
@@ -778,9 +939,7 @@ class AppConfig:
         Returns:
             dict: all configurations.
         """ 
-        if not cls._configs:
-            cls._init_all_configs()
-        return cls._configs
+        return cls._ensure_loaded()[2]
 
 
     @classmethod
@@ -836,19 +995,13 @@ class AppConfig:
         return self.app_path
     
 
-    def get_app_namespaces(self) -> Tuple[str, str]:
+    def get_app_namespaces(self) -> AppNamespaces:
         """
         Get application key in form of (group_key, app_name)
 
         Returns:
-            tuple: (group_key, app_name)
+            AppNamespaces: named tuple of (namespace, name), i.e.,
+                (group_key, app_name)
         """   
-        rs: Tuple[str, str] = ("" ,"")
-        if self.app_key:
-            s = self.app_key.rsplit('.', 1)
-            if len(s) == 1:
-                rs = ("", s[0])
-            elif len(s) > 1:
-                rs = (s[0], s[1])
-        return rs
+        return self._app_namespaces
     
\ No newline at end of file
@@ -47,6 +47,9 @@ class AppConnect:
         ConfigType.DataConnects.value
     ]
 
+    # auth types of user interactive (oauth or saml) connects
+    _OAUTH_SAML_TYPES = frozenset({AppConfig.T_OAUTH, T_AUTH_EXT_BROWSER})
+
     _logger = logging.getLogger(__name__)
 
     # all configurations
@@ -148,12 +151,12 @@ class AppConnect:
                     gk, AppConnect.K_APP_CONN, configs
                 )
         else:
-            gs = dict(configs[AppConnect.K_APP_CONN]).get(gk)
+            gs = configs[AppConnect.K_APP_CONN].get(gk)
             if gs is not None:
                 k = f"{gk}.{ck}" 
-                rd =  configs[AppConnect.K_APP_CONN][gk][ck] if dict(
-                        configs[AppConnect.K_APP_CONN][gk]
-                    ).get(ck) is not None else {}
+                rd = gs.get(ck)
+                if rd is None:
+                    rd = {}
             else:
                 k, rd =  f"{gk}.{ck}", {}
 
@@ -181,20 +184,18 @@ class AppConnect:
         """
         if not data_dict: return None
 
-        default_key = None
-        sorted_keys = sorted(data_dict.keys())
-
-        for k in sorted_keys:
-            if (AppConfig.T_DEFAULT in k.lower()) or \
-                    (AppConfig.T_DEF in k.lower()):
-                default_key = k
-                break
-
-            if "_0" in k:
+        # single pass for the smallest matched key and the smallest key,
+        # i.e., the first ones in sorted order
+        default_key, first_key = None, None
+        for k in data_dict:
+            if first_key is None or k < first_key:
+                first_key = k
+            lk = k.lower()
+            if ((AppConfig.T_DEFAULT in lk) or (AppConfig.T_DEF in lk) or \
+                    ("_0" in k)) and (default_key is None or k < default_key):
                 default_key = k
-                break
 
-        return default_key or sorted_keys[0]
+        return default_key or first_key
     
 
     @classmethod
@@ -233,5 +234,6 @@ class AppConnect:
         or auth_type == "externalbrowser"
         """
         auth_t = self.auth_type
-        return (auth_t == AppConfig.T_OAUTH) or \
-                (auth_t == AppConnect.T_AUTH_EXT_BROWSER)
+        # toml may hold a non-str (unhashable) value for auth_type
+        return isinstance(auth_t, str) and \
+                auth_t in AppConnect._OAUTH_SAML_TYPES
@@ -17,6 +17,7 @@ __version__ = "0.5.0"
 
 
 import logging
+import threading
 from typing import Dict, List, Optional, Union
 
 from snowflake_ai.common import AppConfig
@@ -30,6 +31,7 @@ class ConfigManager:
 
     _logger = logging.getLogger(__name__)
     _app_confs : Dict[str, AppConfig] = {}
+    _app_confs_lock = threading.Lock()
 
 
     def __init__(self):
@@ -51,11 +53,14 @@ class ConfigManager:
 
         ac = ConfigManager._app_confs.get(app_key)
         if ac is None:
-            ac = AppConfig(
-                app_key=app_key, 
-                config_dir=config_dir, 
-                config_file=config_file
-            )
-            ConfigManager._app_confs[app_key] = ac
+            with ConfigManager._app_confs_lock:
+                ac = ConfigManager._app_confs.get(app_key)
+                if ac is None:
+                    ac = AppConfig(
+                        app_key=app_key, 
+                        config_dir=config_dir, 
+                        config_file=config_file
+                    )
+                    ConfigManager._app_confs[app_key] = ac
         
         return ac
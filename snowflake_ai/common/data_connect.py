@@ -18,7 +18,12 @@ __version__ = "0.5.0"
 
 
 import sys
-from typing import Optional, Dict, Union
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from functools import cached_property
+from typing import Optional, Dict, Union, List, Tuple, Any, Callable
+from typing import Iterator
 import logging
 
 from snowflake.snowpark import Session
@@ -27,6 +32,172 @@ from snowflake_ai.common import AppConfig, AppConnect
 
 
 
+class ConnectPool:
+    """
+    This class represents a bounded pool of data connections of one
+    data connect. Idle connections are reused last in, first out, and
+    the ones idle longer than min_evictable_idle_time (in seconds) are
+    closed down to min_idle whenever the pool is used. When max_objects
+    connections are in use, acquire waits up to max_wait seconds.
+
+    Typically, a pool is obtained from a data connect, e.g., SnowConnect:
+
+        >>> with connect.pooled_connection() as session:
+        ...     session.sql("select current_role()").collect()
+    """
+
+    DEF_POOL_CONFIG = {
+        "max_objects": 10,
+        "max_idle": 10,
+        "min_idle": 1,
+        "max_wait": 150.0,
+        "min_evictable_idle_time": 120.0
+    }
+
+    _logger = logging.getLogger(__name__)
+
+
+    def __init__(
+            self,
+            factory: Callable[[], Any],
+            pool_config: Optional[Dict] = None
+        ):
+        """
+        Create a connection pool.
+
+        Args:
+            factory: callable creating a new data connection
+            pool_config: dict overriding DEF_POOL_CONFIG settings
+        """
+        cfg = dict(ConnectPool.DEF_POOL_CONFIG)
+        if pool_config:
+            cfg.update(pool_config)
+        self.factory = factory
+        self.max_objects = int(cfg["max_objects"])
+        self.max_idle = int(cfg["max_idle"])
+        self.min_idle = int(cfg["min_idle"])
+        self.max_wait = float(cfg["max_wait"])
+        self.min_evictable_idle_time = float(cfg["min_evictable_idle_time"])
+
+        # (released_at, connection) of idle connections, oldest first
+        self._idle: List[Tuple[float, Any]] = []
+        self._active = 0
+        self._cond = threading.Condition()
+
+
+    def acquire(self) -> Any:
+        """
+        Borrow an idle connection or create a new one.
+
+        Returns:
+            object: data connection object; None if it cannot be created.
+
+        Raises:
+            TimeoutError: If no connection is released within max_wait.
+        """
+        deadline = time.monotonic() + self.max_wait
+        conn = None
+        with self._cond:
+            evicted = self._evict()
+            while True:
+                if self._idle:
+                    _, conn = self._idle.pop()
+                    self._active += 1
+                    break
+                if self._active < self.max_objects:
+                    self._active += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        "ConnectPool.acquire(): Error - no connection "\
+                        f"released within [{self.max_wait}] seconds!"
+                    )
+                self._cond.wait(remaining)
+        ConnectPool._close_all(evicted)
+        if conn is not None:
+            return conn
+
+        try:
+            conn = self.factory()
+        finally:
+            if conn is None:
+                with self._cond:
+                    self._active -= 1
+                    self._cond.notify()
+        return conn
+
+
+    def release(self, conn: Any):
+        """
+        Return a borrowed connection to the pool, or close it when
+        max_idle connections are already idle.
+
+        Args:
+            conn: connection object obtained from acquire(); None is
+                ignored since acquire() already freed its slot
+        """
+        if conn is None:
+            return
+        with self._cond:
+            self._active = max(0, self._active - 1)
+            if len(self._idle) < self.max_idle:
+                self._idle.append((time.monotonic(), conn))
+                conn = None
+            evicted = self._evict()
+            self._cond.notify()
+        ConnectPool._close_all(evicted if conn is None else evicted + [conn])
+
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Borrow a connection which is released when the block exits.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+
+    def close(self):
+        """
+        Close all idle connections of the pool.
+        """
+        with self._cond:
+            evicted = [c for _, c in self._idle]
+            self._idle.clear()
+        ConnectPool._close_all(evicted)
+
+
+    def _evict(self) -> List[Any]:
+        # caller holds the lock; connections are closed outside of it
+        cutoff = time.monotonic() - self.min_evictable_idle_time
+        n = 0
+        while len(self._idle) - n > self.min_idle and \
+                self._idle[n][0] < cutoff:
+            n += 1
+        evicted = [c for _, c in self._idle[:n]]
+        del self._idle[:n]
+        return evicted
+
+
+    @staticmethod
+    def _close_all(conns: List[Any]):
+        for conn in conns:
+            close = getattr(conn, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    ConnectPool._logger.warning(
+                        "ConnectPool._close_all(): Cannot close "\
+                        "connection; Error - %s!", e
+                    )
+
+
+
 class DataConnect(AppConnect):
     """
     This class represents a generic data connection.
@@ -44,6 +215,10 @@ class DataConnect(AppConnect):
 
     K_DATA_CONN = ConfigType.DataConnects.value
     K_INIT_LIST = ConfigKey.INIT_LIST.value
+    K_POOL = "pool"
+
+    # keys of [app_connects.data_connects] which aren't data connects
+    _NON_CONNECT_KEYS = frozenset({K_INIT_LIST, K_POOL})
 
     _logger = logging.getLogger(__name__)
 
@@ -52,6 +227,13 @@ class DataConnect(AppConnect):
     # {<connect_key>: file-connect-string|snowflake-connection-obj}
     _data_connections = {}
 
+    # {<connect_key>: params} of init_list connections not yet created
+    _pending_connects: Dict[str, Dict] = {}
+
+    # {<connect_key>: ConnectPool of the data connect}
+    _connect_pools: Dict[str, ConnectPool] = {}
+    _connect_pools_lock = threading.Lock()
+
 
     def __init__(
             self, 
@@ -61,6 +243,8 @@ class DataConnect(AppConnect):
         super().__init__(connect_key, app_config)
         self.logger = DataConnect._logger
         self._current_connection = None
+        # pending init_list connect to become current on first use
+        self._init_connect_key: Optional[str] = None
 
         # load default data service connection
         if (connect_key is None or not connect_key or \
@@ -120,6 +304,21 @@ class DataConnect(AppConnect):
             
 
 
+    @cached_property
+    def _data_connect_group(self) -> Dict:
+        # [app_connects.data_connects] section of the bound configs
+        return self._configs[AppConnect.K_APP_CONN].get(
+                DataConnect.K_DATA_CONN, {})
+
+
+    def _get_connect_params(self, name: str) -> Optional[Dict]:
+        # settings tables, e.g., pool, share the section with connects
+        if name in DataConnect._NON_CONNECT_KEYS:
+            return None
+        params = self._data_connect_group.get(name)
+        return params if isinstance(params, dict) else None
+
+
     @property
     def data_connections(self) -> Dict:
         """
@@ -250,6 +449,8 @@ class DataConnect(AppConnect):
                 snowflake connection; it can return None.
         """
         if connect_key is None:
+            # current as if init_connects() had created it eagerly
+            self.set_current_connection(self._promote_pending_connect())
             if self._current_connection is None:
                 if self.data_connections:
                     k = DataConnect.search_default_key(self.data_connections)
@@ -280,26 +481,42 @@ class DataConnect(AppConnect):
             )
             if self.data_connections.get(qk) is None:
                 gk, k = AppConfig.split_group_key(qk)
-                params = self._configs[ConfigType.AppConnects.value]\
-                    [DataConnect.K_DATA_CONN][k]
+                params = self._get_connect_params(k)
+                if params is None:
+                    self.logger.error(
+                        "DataConnect.get_connection(): Error - [%s] is not"\
+                        " a data connect!", connect_key
+                    )
+                    return None
                 self.connect_key = qk
                 self.connect_params = params
                 self.connect_group = gk
                 if self.is_service_connect():
                     self.data_connections[qk] = self.create_connection(params)
                     self._current_connection = self.data_connections[qk]
+                    self._init_connect_key = None
+                    DataConnect._pending_connects.pop(qk, None)
 
             return self.data_connections.get(qk)
 
 
-    def init_connects(self) -> int:
+    def init_connects(self, eager: bool = True) -> int:
         """
         Initialize DataConnect in [app_connects.data_connects] init_list.
+        With eager set to False, connections are only recorded and
+        created when first requested through get_connection() of this
+        DataConnect; the last init_list connect becomes its current
+        connection on the first call without a key. Other DataConnect
+        objects don't see such pending connections until created.
+
+        Args:
+            eager (bool): create the connections right away, default True
 
         Returns:
             int: 0 - if there is no connect object has been initialized;
                 otherwise, return an integer to show the number of 
-                AppConnect objects have been initialized.
+                AppConnect objects have been initialized, including the
+                ones to be connected on first use.
         """
         if not DataConnect._initialized:
             conn_group_dict = AppConfig.filter_group_key(
@@ -310,9 +527,7 @@ class DataConnect(AppConnect):
             lst = conn_group_dict.get(DataConnect.K_INIT_LIST)
             if lst is not None and len(lst) > 0 :
                 for dconn in lst:
-                    dc: dict = self._configs[AppConnect.K_APP_CONN]\
-                        [DataConnect.K_DATA_CONN]
-                    params = dc.get(dconn)
+                    params = self._get_connect_params(dconn)
                     if params is None:
                         raise ValueError(
                             f"DataConnect.init_connets(): Error - [{dconn}]"\
@@ -320,20 +535,43 @@ class DataConnect(AppConnect):
                         )
                     elif self.is_service_connect():
                         s = f"{DataConnect.K_DATA_CONN}.{dconn}"
-                        if self.data_connections.get(s) is None:
-                            self.data_connections[s] = \
-                                    self.create_connection(params)
+                        if self.data_connections.get(s) is not None:
+                            continue
+                        DataConnect._pending_connects[s] = params
+                        if eager:
                             self.set_current_connection(
-                                    self.data_connections[s]
+                                    self._establish_connection(s)
                                 )
+                        else:
+                            self._init_connect_key = s
                 DataConnect._initialized = True
         
         n = len(self.data_connections)
         self.logger.debug(
-            f"DataConnect.init_connects(): [{n}] shared (service) "\
-            f"data connections have been established."
+            "DataConnect.init_connects(): [%s] shared (service) data "\
+            "connections have been established; [%s] to be connected "\
+            "on first use.", n, len(DataConnect._pending_connects)
         )
-        return n
+        return n + len(DataConnect._pending_connects)
+
+
+    def _promote_pending_connect(self):
+        # connect the last init_list connect of this DataConnect once
+        k, self._init_connect_key = self._init_connect_key, None
+        return None if k is None else self._establish_connection(k)
+
+
+    def _establish_connection(self, connect_key: str):
+        # get shared connection, creating it if it is still pending
+        conn = self.data_connections.get(connect_key)
+        if conn is None:
+            params = DataConnect._pending_connects.get(connect_key)
+            if params is not None and self.is_service_connect():
+                conn = self.create_connection(params)
+                if conn is not None:
+                    self.data_connections[connect_key] = conn
+                    DataConnect._pending_connects.pop(connect_key, None)
+        return conn
 
 
     def is_service_connect(self) -> bool:
@@ -341,4 +579,100 @@ class DataConnect(AppConnect):
         Return whether this application connect is service type.
         This should be overridden by its childen class.
         """
-        return False
\ No newline at end of file
+        return False
+
+
+    def get_connect_pool(
+            self, 
+            connect_key: Optional[str] = None
+        ) -> Optional[ConnectPool]:
+        """
+        Get the connection pool of a data connect, created on first use
+        with settings of [app_connects.data_connects.pool], if any.
+
+        Args:
+            connect_key (str): data connect key in form of
+                "data_connects".<connect_name>; current connect if None
+
+        Returns:
+            ConnectPool: connection pool shared by the data connect; None
+                if the key isn't a data connect.
+        """
+        try:
+            qk = AppConfig.get_qualified_key(
+                ConfigType.AppConnects.value, connect_key
+            ) if connect_key else self.connect_key
+        except ValueError:
+            qk = None
+        pool = DataConnect._connect_pools.get(qk)
+        if pool is None:
+            gk, k = AppConfig.split_group_key(qk)
+            params = self._get_connect_params(k) \
+                    if gk == DataConnect.K_DATA_CONN else None
+            if params is None:
+                self.logger.error(
+                    "DataConnect.get_connect_pool(): Error - [%s] is not a"\
+                    " data connect!", connect_key or qk
+                )
+                return None
+            with DataConnect._connect_pools_lock:
+                pool = DataConnect._connect_pools.get(qk)
+                if pool is None:
+                    pool = ConnectPool(
+                        lambda: self.create_connection(params),
+                        self._data_connect_group.get(DataConnect.K_POOL)
+                    )
+                    DataConnect._connect_pools[qk] = pool
+        return pool
+
+
+    def acquire_connection(self, connect_key: Optional[str] = None):
+        """
+        Borrow a data connection from the connect's pool; it should be
+        given back with release_connection().
+
+        Args:
+            connect_key (str): data connect key in form of
+                "data_connects".<connect_name>; current connect if None
+
+        Returns:
+            object: data connection object, e.g., snowflake session; None
+                if the key isn't a data connect.
+        """
+        pool = self.get_connect_pool(connect_key)
+        return pool.acquire() if pool is not None else None
+
+
+    def release_connection(
+            self, 
+            conn, 
+            connect_key: Optional[str] = None
+        ):
+        """
+        Give back a data connection borrowed by acquire_connection().
+
+        Args:
+            conn: data connection object
+            connect_key (str): data connect key the connection is
+                borrowed from; current connect if None
+        """
+        pool = self.get_connect_pool(connect_key)
+        if pool is not None:
+            pool.release(conn)
+
+
+    def pooled_connection(self, connect_key: Optional[str] = None):
+        """
+        Borrow a pooled data connection for a with block, e.g.,
+        "with connect.pooled_connection() as session: ...".
+
+        Args:
+            connect_key (str): data connect key in form of
+                "data_connects".<connect_name>; current connect if None
+
+        Returns:
+            context manager yielding the data connection object, or None
+                if the key isn't a data connect
+        """
+        pool = self.get_connect_pool(connect_key)
+        return pool.connection() if pool is not None else nullcontext()
@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from snowflake_ai.apps import AppPage
+from snowflake_ai.apps import app_page
+
+
+@pytest.fixture
+def fake_st(monkeypatch):
+    st = mock.MagicMock()
+    st.session_state = SimpleNamespace()
+    monkeypatch.setattr(app_page, "st", st)
+    return st
+
+
+def test_render_sidebar_resets_page(fake_st):
+    fake_st.experimental_get_query_params.return_value = {
+        "page": ["/detail"], "state": ["loggedin"]
+    }
+    AppPage("/").render_sidebar()
+    fake_st.experimental_set_query_params.assert_called_once_with(
+        page="/", state="loggedin"
+    )
+    assert fake_st.session_state.login is True
+
+
+def test_render_sidebar_skips_unchanged_url(fake_st):
+    fake_st.experimental_get_query_params.return_value = {
+        "page": ["/"], "state": ["loggedoff"]
+    }
+    fake_st.session_state.login = False
+    AppPage("/").render_sidebar()
+    fake_st.experimental_set_query_params.assert_not_called()
+    assert fake_st.session_state.login is False
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,135 @@
+import os
+from unittest import mock
+
+import pytest
+
+from snowflake_ai.common import AppConfig
+from snowflake_ai.apps import StreamlitApp
+from snowflake_ai.apps import base_app, streamlit_app
+
+
+_setup_streamlit_config = StreamlitApp._setup_streamlit_config
+
+
+class FakeQueryParams:
+    def __init__(self):
+        self.params = {}
+
+    def get(self):
+        return dict(self.params)
+
+    def set(self, **kwargs):
+        self.params = {k: [v] for k, v in kwargs.items()}
+
+
+@pytest.fixture
+def fake_st(monkeypatch):
+    qp = FakeQueryParams()
+    st = mock.MagicMock()
+    st.experimental_get_query_params.side_effect = qp.get
+    st.experimental_set_query_params.side_effect = qp.set
+    monkeypatch.setattr(streamlit_app, "st", st)
+    return st
+
+
+@pytest.fixture
+def app(monkeypatch, fake_st):
+    ac = mock.MagicMock()
+    ac.app_key = "streamlit_default.app_1"
+    ac.type = "streamlit"
+    snow_connect = mock.MagicMock()
+    snow_connect.get_connection.return_value = None
+    snow_connect.create_user_session.return_value = None
+
+    cm = mock.MagicMock()
+    cm.get_app_config.return_value = ac
+    monkeypatch.setattr(base_app, "ConfigManager", cm)
+    connects = mock.MagicMock()
+    connects.create_default_snow_connect.return_value = snow_connect
+    monkeypatch.setattr(base_app, "ConnectManager", connects)
+    monkeypatch.setattr(base_app, "SetupManager", mock.MagicMock())
+    monkeypatch.setattr(AppConfig, "get_all_configs", lambda: {})
+    monkeypatch.setattr(AppConfig, "load_module", lambda script: None)
+    monkeypatch.setattr(
+        StreamlitApp, "_setup_streamlit_config", lambda self: None
+    )
+    return StreamlitApp(ac.app_key)
+
+
+def test_navigate_to_runs_target_page(app, fake_st):
+    calls = []
+
+    @app.register_page("/", title="Home")
+    def home():
+        calls.append("home")
+
+    @app.register_page("/detail", title="Detail", layout="centered")
+    def detail():
+        calls.append("detail")
+
+    app.run()
+    assert calls == ["home"]
+
+    app.navigate_to("/detail")
+    assert calls == ["home", "detail"]
+    assert fake_st.experimental_get_query_params() == {
+        "previous_page": ["/"], "page": ["/detail"]
+    }
+
+    app.set_pages_config()
+    fake_st.set_page_config.assert_called_once_with(
+        page_title="Detail", page_icon=None, layout="centered"
+    )
+
+
+def test_run_unknown_page_reports_error(app, fake_st):
+    fake_st.experimental_set_query_params(page="/missing")
+    app.run()
+    fake_st.error.assert_called_once_with("Page not found!")
+
+
+def test_default_pipeline_needs_session(app):
+    app.appconf.ml_pipeline_refs = ["ml_pipelines.pipeline_1"]
+    assert app.default_context.session is None
+    assert app.default_pipeline is None
+    with pytest.raises(ValueError):
+        app.run_default_pipeline()
+
+
+def test_setup_streamlit_config_writes_only_changes(app, tmp_path, 
+        monkeypatch):
+    app.appconf.root_path = str(tmp_path)
+    app.appconf.script_home = "."
+    monkeypatch.setattr(streamlit_app, "_rendered_streamlit_toml",
+            lambda app_key: "[server]\nport = 8501\n")
+
+    conf_path = _setup_streamlit_config(app)
+    assert open(conf_path).read() == "[server]\nport = 8501\n"
+    assert os.listdir(os.path.dirname(conf_path)) == ["config.toml"]
+
+    # an unchanged file is skipped by its stat stamp, not read again
+    reads = []
+    file_digest = streamlit_app._file_digest
+    monkeypatch.setattr(streamlit_app, "_file_digest",
+            lambda path: reads.append(path) or file_digest(path))
+    assert _setup_streamlit_config(app) == conf_path
+    assert reads == []
+
+    # an edited file of the same size is compared by digest and rewritten
+    with open(conf_path, "w") as f:
+        f.write("[server]\nport = 8502\n")
+    _setup_streamlit_config(app)
+    assert reads == [conf_path]
+    assert open(conf_path).read() == "[server]\nport = 8501\n"
+
+
+def test_only_config_attributes_are_delegated(app):
+    assert app.app_key == "streamlit_default.app_1"
+    with pytest.raises(AttributeError, match="app_kye"):
+        app.app_kye
+    with pytest.raises(AttributeError):
+        app.get_all_configs
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
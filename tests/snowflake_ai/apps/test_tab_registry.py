@@ -0,0 +1,28 @@
+from snowflake_ai.apps.tab_registry import TabRegistry
+
+
+def test_duplicate_tab_id_replaces_tab():
+    registry = TabRegistry()
+
+    @registry.register("home", "Home")
+    def home_v1():
+        pass
+
+    @registry.register("data")
+    def data_tab():
+        pass
+
+    @registry.register("home", "Home")
+    def home_v2():
+        pass
+
+    assert [t.tab_id for t in registry.tab_list] == ["home", "data"]
+    assert registry.tab_list[0].func is home_v2
+
+    tabs = registry.create_page_tabs()
+    assert list(tabs) == ["home", "data"]
+    assert all(t.get_tab() is not None for t in registry.tab_list)
+
+
+if __name__ == '__main__':
+    test_duplicate_tab_id_replaces_tab()
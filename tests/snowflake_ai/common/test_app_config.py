@@ -1,3 +1,9 @@
+import copy
+import json
+import os
+import threading
+import time
+
 from snowflake_ai.common import AppConfig, ConfigType
 
 
@@ -10,6 +16,93 @@ def test_base_app():
     ba = a.get_all_configs().get(ConfigType.BaseApps.value)
     assert len(ba) > 0
 
+def test_load_toml_files_newest_section_wins(tmp_path):
+    old, new = tmp_path / "a.toml", tmp_path / "b.toml"
+    old.write_text('title = "old"\n[apps.g]\nk = 1\n[base_apps.g]\nk = 1\n')
+    new.write_text('[apps.g]\nk = 2\n')
+    os.utime(old, (1, 1))
+    cfg = AppConfig._load_toml_files(str(tmp_path))
+    assert type(cfg) is dict
+    assert cfg == {
+        "title": "old", "apps": {"g": {"k": 2}}, "base_apps": {"g": {"k": 1}}
+    }
+    assert json.loads(json.dumps(cfg)) == cfg
+    assert copy.deepcopy(cfg) == cfg
+
+def test_load_toml_files_multiline_array(tmp_path):
+    (tmp_path / "a.toml").write_text(
+        'values = [\n  ["a", "b"],\n  [ "c" ]\n]\ntitle = "t"\n'\
+        's = """\n[c]\n\\"""\n[d]\n"""\n[apps.g]\nk = 1\n'
+    )
+    cfg = AppConfig._load_toml_files(str(tmp_path))
+    assert cfg == {
+        "values": [["a", "b"], ["c"]], "title": "t",
+        "s": '[c]\n"""\n[d]\n', "apps": {"g": {"k": 1}}
+    }
+
+def test_load_toml_file_normalizes_root_keys_only(tmp_path):
+    (tmp_path / "a.toml").write_text('[Apps.Group_A]\nApp_Name = "x"\n')
+    cfg = AppConfig._load_toml_files(str(tmp_path), "a.toml")
+    assert cfg == {"apps": {"Group_A": {"App_Name": "x"}}}
+
+def test_init_all_configs_loads_once(monkeypatch):
+    calls = []
+
+    def slow_load_configs(config_dir=None, config_file=None):
+        calls.append(config_dir)
+        time.sleep(0.1)
+        return "root", "path", {"apps": {}}
+
+    for name in ("_configs_root", "_configs_path", "_configs", "_key_index"):
+        monkeypatch.setattr(AppConfig, name, getattr(AppConfig, name))
+    monkeypatch.setattr(AppConfig, "_initialized", False)
+    monkeypatch.setattr(AppConfig, "load_configs", 
+            staticmethod(slow_load_configs))
+
+    roots = []
+    threads = [
+        threading.Thread(target=lambda: roots.append(
+            AppConfig._init_all_configs()))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == [None]
+    assert roots == ["root"] * 4
+    assert AppConfig._configs == {"apps": {}}
+
+def test_unqualified_app_key_resolves_group(monkeypatch):
+    configs = {
+        "apps": {"group_def": {"app1": {"name": "App 1"}}},
+        "base_apps": {"group_def": {"app1": {}}}
+    }
+    for name in ("_configs_root", "_configs_path", "_configs", "_key_index"):
+        monkeypatch.setattr(AppConfig, name, getattr(AppConfig, name))
+    monkeypatch.setattr(AppConfig, "_apps", {})
+    monkeypatch.setattr(AppConfig, "_filtered_group_cache", {})
+    monkeypatch.setattr(AppConfig, "_qualified_key_cache", {})
+    monkeypatch.setattr(AppConfig, "_initialized", False)
+    monkeypatch.setattr(AppConfig, "load_configs", 
+            staticmethod(lambda d=None, f=None: ("root", "path", configs)))
+
+    a = AppConfig("group_def.app1")
+    b = AppConfig("app1")
+    assert b is not a
+    assert b.app_key == a.app_key == "group_def.app1"
+    assert AppConfig._apps["group_def.app1"] is b
+
+def test_filter_group_key_returns_own_copy(monkeypatch):
+    configs = {"apps": {"g": {"k": 1, "app1": {"name": "App 1"}}}}
+    monkeypatch.setattr(AppConfig, "_configs", configs)
+    monkeypatch.setattr(AppConfig, "_filtered_group_cache", {})
+
+    d = AppConfig.filter_group_key("g", "apps", configs)
+    assert d == {"k": 1}
+    d["k"] = 2
+    assert AppConfig.filter_group_key("g", "apps", configs) == {"k": 1}
+
 
 if __name__ == '__main__':
-    test_init_app()
\ No newline at end of file
+    test_init_app()
@@ -0,0 +1,32 @@
+import threading
+import time
+
+from snowflake_ai.common import config_manager
+from snowflake_ai.common import ConfigManager
+
+
+def test_get_app_config_creates_once(monkeypatch):
+    created = []
+
+    class SlowAppConfig:
+        def __init__(self, app_key, config_dir=None, config_file=None):
+            created.append(app_key)
+            time.sleep(0.1)
+            self.app_key = app_key
+
+    monkeypatch.setattr(config_manager, "AppConfig", SlowAppConfig)
+    monkeypatch.setattr(ConfigManager, "_app_confs", {})
+
+    acs = []
+    threads = [
+        threading.Thread(target=lambda: acs.append(
+            ConfigManager.get_app_config("group_def.app1")))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert created == ["group_def.app1"]
+    assert len(acs) == 4 and all(ac is acs[0] for ac in acs)
+
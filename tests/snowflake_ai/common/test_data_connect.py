@@ -0,0 +1,218 @@
+import threading
+import time
+
+import pytest
+
+from snowflake_ai.common import AppConfig, AppConnect
+from snowflake_ai.common.data_connect import ConnectPool, DataConnect
+
+
+class FakeConn:
+    def __init__(self, n):
+        self.n = n
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConfig:
+    def __init__(self, configs):
+        self.configs = configs
+
+    def get_all_configs(self):
+        return self.configs
+
+
+class ServiceConnect(DataConnect):
+    created = []
+
+    def is_service_connect(self):
+        return True
+
+    def create_connection(self, params):
+        conn = FakeConn(params["host"])
+        ServiceConnect.created.append(conn)
+        return conn
+
+
+def _configs(init_list=()):
+    return {
+        "app_connects": {
+            "data_connects": {
+                "init_list": list(init_list),
+                "pool": {"max_objects": 2, "min_idle": 0},
+                "db_1": {"type": "test", "host": "h1"},
+                "db_2": {"type": "test", "host": "h2"},
+            }
+        }
+    }
+
+
+@pytest.fixture
+def connect_state(monkeypatch):
+    monkeypatch.setattr(AppConnect, "_connects", {})
+    monkeypatch.setattr(DataConnect, "_data_connections", {})
+    monkeypatch.setattr(DataConnect, "_pending_connects", {})
+    monkeypatch.setattr(DataConnect, "_connect_pools", {})
+    monkeypatch.setattr(DataConnect, "_initialized", False)
+    monkeypatch.setattr(ServiceConnect, "created", [])
+
+
+def _pool(**pool_config):
+    conns = []
+
+    def factory():
+        conns.append(FakeConn(len(conns)))
+        return conns[-1]
+
+    return ConnectPool(factory, pool_config), conns
+
+
+def test_pool_acquire_release_reuses_connection():
+    pool, conns = _pool()
+    c1 = pool.acquire()
+    pool.release(c1)
+    assert pool.acquire() is c1
+    c2 = pool.acquire()
+    assert c2 is not c1 and len(conns) == 2
+
+    with pool.connection() as c3:
+        assert c3 is conns[2]
+    assert not c3.closed
+
+
+def test_pool_acquire_waits_at_max_objects():
+    pool, _ = _pool(max_objects=1, max_wait=0.05)
+    pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+
+def test_pool_failed_create_keeps_active_count():
+    pool, _ = _pool(max_objects=2, max_wait=0.05)
+    held = pool.acquire()
+    pool.factory = lambda: None
+
+    def borrow_failed():
+        with pool.connection() as conn:
+            assert conn is None
+
+    threads = [threading.Thread(target=borrow_failed) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # held still counts against max_objects, so one more borrow fits
+    pool.factory = lambda: FakeConn(1)
+    assert pool.acquire() is not held
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+
+def test_pool_release_closes_beyond_max_idle():
+    pool, _ = _pool(max_idle=1)
+    c1, c2 = pool.acquire(), pool.acquire()
+    pool.release(c1)
+    pool.release(c2)
+    assert not c1.closed and c2.closed
+
+
+def test_pool_evicts_idle_connections_down_to_min_idle():
+    pool, _ = _pool(min_idle=1, min_evictable_idle_time=0.01)
+    c1, c2, c3 = pool.acquire(), pool.acquire(), pool.acquire()
+    for c in (c1, c2, c3):
+        pool.release(c)
+    time.sleep(0.02)
+
+    # oldest idle connections are closed, the newest one is kept
+    assert pool.acquire() is c3
+    assert c1.closed and c2.closed and not c3.closed
+
+
+def test_pool_key_is_not_a_data_connect(connect_state):
+    dc = ServiceConnect("data_connects.db_1", FakeConfig(_configs()))
+    pool = dc.get_connect_pool()
+    assert pool.max_objects == 2 and pool.min_idle == 0
+    assert dc.acquire_connection().n == "h1"
+
+    assert dc.get_connect_pool("pool") is None
+    assert dc.get_connect_pool("no_such_connect") is None
+    assert dc.acquire_connection("pool") is None
+    with dc.pooled_connection("pool") as conn:
+        assert conn is None
+
+    dc = ServiceConnect("data_connects.db_1", FakeConfig(_configs(["pool"])))
+    with pytest.raises(ValueError):
+        dc.init_connects()
+
+
+def test_init_connects_defers_connections(connect_state, monkeypatch):
+    monkeypatch.setattr(
+        AppConfig, "get_qualified_key",
+        staticmethod(lambda root_key, key: f"data_connects.{key}")
+    )
+    dc = ServiceConnect("data_connects.db_1", FakeConfig(_configs(["db_2"])))
+    assert dc.init_connects(eager=False) == 1
+    assert ServiceConnect.created == []
+    assert list(DataConnect._pending_connects) == ["data_connects.db_2"]
+
+    conn = dc.get_connection("db_2")
+    assert conn.n == "h2" and ServiceConnect.created == [conn]
+    assert DataConnect._pending_connects == {}
+    assert dc.get_connection("db_2") is conn
+
+
+def test_init_connects_lazy_current_connection(connect_state, monkeypatch):
+    monkeypatch.setattr(
+        AppConfig, "get_qualified_key",
+        staticmethod(lambda root_key, key: f"data_connects.{key}")
+    )
+    dc = ServiceConnect("data_connects.db_1", FakeConfig(_configs(["db_2"])))
+    dc.init_connects(eager=False)
+    assert ServiceConnect.created == []
+
+    # the init connect is current, as it would be if created eagerly
+    conn = dc.get_connection()
+    assert conn.n == "h2" and ServiceConnect.created == [conn]
+    assert dc.get_connection() is conn
+
+    # later connects share it rather than creating another connection
+    other = ServiceConnect("data_connects.db_1", FakeConfig(_configs()))
+    assert other.get_connection() is conn
+    assert ServiceConnect.created == [conn]
+
+
+def test_init_connects_lazy_keyed_lookup_wins(connect_state, monkeypatch):
+    monkeypatch.setattr(
+        AppConfig, "get_qualified_key",
+        staticmethod(lambda root_key, key: f"data_connects.{key}")
+    )
+    dc = ServiceConnect("data_connects.db_1", FakeConfig(_configs(["db_2"])))
+    dc.init_connects(eager=False)
+
+    # a lookup by key after init sets current, just as with eager init
+    conn = dc.get_connection("db_1")
+    assert conn.n == "h1"
+    assert dc.get_connection() is conn
+    assert list(DataConnect._pending_connects) == ["data_connects.db_2"]
+
+
+def test_init_connects_eager(connect_state):
+    dc = ServiceConnect("data_connects.db_1", FakeConfig(_configs(["db_2"])))
+    assert dc.init_connects() == 1
+    assert [c.n for c in ServiceConnect.created] == ["h2"]
+    assert DataConnect._pending_connects == {}
+    assert dc.get_connection() is ServiceConnect.created[0]
+
+    # connects created afterwards bind to the shared connection
+    other = ServiceConnect("data_connects.db_1", FakeConfig(_configs()))
+    assert other.get_connection() is ServiceConnect.created[0]
+
+
+if __name__ == '__main__':
+    test_pool_acquire_release_reuses_connection()
+    test_pool_acquire_waits_at_max_objects()
+    test_pool_release_closes_beyond_max_idle()
+    test_pool_evicts_idle_connections_down_to_min_idle()